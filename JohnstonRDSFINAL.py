@@ -9,7 +9,13 @@
 from psychopy import core, data, gui, monitors, visual
 from psychopy.hardware import keyboard
 import numpy as np
-import os, math
+import os, math, zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit, prange  # optional: fused RDS kernel for DYNAMIC_RDS
+except ImportError:
+    njit = None
 
 # ========================= RIG CONFIG =========================
 WIN_TYPE = "glfw"         # GLFW tends to be steadier than pyglet for dual fullscreens on Windows
@@ -80,79 +86,249 @@ if MEASURE_BOTH_REFRESH:
     fr_right = win_right.getActualFrameRate(nIdentical=90, nWarmUpFrames=60) or 60.0
 else:
     fr_right = fr_left
+    # No second probe: compare against the rate PsychoPy recorded when win_right opened
+    # (monitorFramePeriod, no extra flips). Mismatched panels are a rig fault, so say so.
+    period_right = getattr(win_right, "monitorFramePeriod", None)
+    if period_right and abs(1.0 / period_right - fr_left) > 0.5:
+        print(f"WARNING: right panel reports {1.0 / period_right:.2f}Hz vs measured left "
+              f"{fr_left:.2f}Hz — check display settings or set MEASURE_BOTH_REFRESH = True")
 refresh_min_hz = min(fr_left, fr_right)
 stim_frames = int(round(stim_duration_s * refresh_min_hz))
 print(f"Refresh L:{fr_left:.2f}Hz R:{fr_right:.2f}Hz → scheduling {stim_frames} frames ({stim_duration_s:.2f}s)")
 
 # ======================== GEOMETRY HELPERS ==========================
-def project_to_screen(x_cm, z_cm, distance_cm, iod_cm):
-    """Binocular pinhole projection for frontoparallel screen at distance_cm (z=0 plane)."""
-    half = iod_cm / 2.0
-    depth_from_eye = np.maximum(distance_cm - z_cm, 0.5)  # avoid division explosions
-    scale = distance_cm / depth_from_eye
-    xL = -half + scale * (x_cm + half)
-    xR =  half + scale * (x_cm - half)
-    disp_cm = xR - xL
-    disp_rad = disp_cm / distance_cm  # small-angle approximation
-    safe_z = np.clip(z_cm, None, distance_cm - 0.5)
-    disp_formula = (iod_cm * safe_z) / ((distance_cm**2) - (safe_z**2))
-    return xL, xR, disp_cm, disp_rad, disp_formula
-
-def generate_rds(a, b, dist, iod, n, y_semi, aperture, width, offset_cm=None):
-    """Return per-eye dot coordinates for a half-elliptical cylinder RDS + disparity stats."""
-    half_width = width / 2.0
+# Viewing geometry is fixed once the dialog closes, so fold it into constants
+_HALF_IOD = interocular_cm / 2.0
+_DIST = screen_distance_cm
+_INV_DIST = 1.0 / _DIST
+
+# PCG64: one Generator shared by every dot draw. Seeded from participant + session (crc32,
+# unlike hash() stable across runs) so a session's dot patterns can be replayed exactly.
+rng_seed = zlib.crc32(f"{exp_info['participant']}|{exp_info['session']}".encode("utf-8"))
+exp_info["rng_seed"] = rng_seed  # saved with the data as extraInfo
+rng = np.random.default_rng(rng_seed)
+
+def project_to_screen(x_cm, z_cm, xL_buf, xR_buf, dcm_buf, dang_buf):
+    """Binocular pinhole projection for frontoparallel screen at _DIST (z=0 plane).
+
+    Results are written into the caller's buffers (same shape as x_cm) and returned as views.
+    """
+    # dang_buf holds the per-dot scale until the angular disparity overwrites it
+    scale = dang_buf
+    np.subtract(_DIST, z_cm, out=scale)
+    np.maximum(scale, 0.5, out=scale)  # avoid division explosions
+    np.divide(_DIST, scale, out=scale)
+
+    np.add(x_cm, _HALF_IOD, out=xL_buf)
+    np.multiply(xL_buf, scale, out=xL_buf)
+    np.subtract(xL_buf, _HALF_IOD, out=xL_buf)
+    np.subtract(x_cm, _HALF_IOD, out=xR_buf)
+    np.multiply(xR_buf, scale, out=xR_buf)
+    np.add(xR_buf, _HALF_IOD, out=xR_buf)
+
+    np.subtract(xR_buf, xL_buf, out=dcm_buf)
+    np.multiply(dcm_buf, _INV_DIST, out=dang_buf)  # small-angle approximation
+    return xL_buf, xR_buf, dcm_buf, dang_buf
+
+# Shared per-batch scratch rows (see _rds_batch_numpy), grown on demand.
+# Not locked: the main thread must not call generate_rds while bank_future is pending.
+_batch_rows = np.empty((7, 0), dtype=np.float32)
+_batch_flags = np.empty((2, 0), dtype=np.bool_)
+
+def _batch_buffers(batch):
+    global _batch_rows, _batch_flags
+    if _batch_rows.shape[1] < batch:
+        _batch_rows = np.empty((7, batch), dtype=np.float32)
+        _batch_flags = np.empty((2, batch), dtype=np.bool_)
+    return _batch_rows[:, :batch], _batch_flags[:, :batch]
+
+def _rds_batch_numpy(u, a, b, y_semi, aperture, offset_cm, half_width, check_bounds):
+    """Map (batch, 2) uniforms to projected dots; returns xL, xR, y, dcm, dang, keep.
+
+    Every step writes into the shared batch buffers (out=), so a batch allocates nothing.
+    xL/xR serve as scratch until the projection fills them.
+    """
+    (xL, xR, y, dcm, dang, x, z), (keep, inside) = _batch_buffers(u.shape[0])
+
+    # Uniform in the bounding square; the aperture disk is a compare (no sqrt/sin/cos)
+    np.multiply(u[:, 0], 2 * aperture, out=x)
+    np.subtract(x, aperture, out=x)
+    np.multiply(u[:, 1], 2 * aperture, out=y)
+    np.subtract(y, aperture, out=y)
+    np.multiply(x, x, out=xL)  # x^2 and y^2 are reused by the ellipse test below
+    np.multiply(y, y, out=xR)
+    np.add(xL, xR, out=dcm)
+    np.less_equal(dcm, aperture * aperture, out=keep)
+
+    # Half-cylinder surface: inside ellipse gets z>0 (bulges toward observer), outside z=0.
+    # Computed over every dot (no gather/scatter): the profile depends on x only, and the
+    # ellipse test (x/a)^2 + (y/y_semi)^2 <= 1 is y^2/y_semi^2 <= t with t = 1 - x^2/a^2
+    # (reciprocal squares precomputed, so multiplies instead of divides)
+    t = z  # t lives in z's buffer until the sqrt turns it into the depth
+    np.multiply(xL, 1 / (a * a), out=t)
+    np.subtract(1, t, out=t)
+    np.multiply(xR, 1 / (y_semi * y_semi), out=xL)
+    np.less_equal(xL, t, out=inside)
+    np.maximum(t, 0, out=t)  # outside dots may go negative; keep sqrt NaN-free
+    np.sqrt(t, out=z)
+    np.multiply(z, b, out=z)
+    np.multiply(z, inside, out=z)
+
+    project_to_screen(x, z, xL, xR, dcm, dang)
+    if offset_cm:
+        # Haploscope horizontal calibration (equal and opposite shifts)
+        xL -= offset_cm
+        xR += offset_cm
+
+    # Keep only dots inside the aperture and visible to BOTH eyes (prevents monocular ghosts).
+    # z and the inside mask are dead after projection, so they double as scratch buffers.
+    # generate_rds clears check_bounds when every dot provably lands on the panel.
+    if check_bounds:
+        np.less_equal(np.abs(xL, out=z), half_width, out=inside)
+        np.logical_and(keep, inside, out=keep)
+        np.less_equal(np.abs(xR, out=z), half_width, out=inside)
+        np.logical_and(keep, inside, out=keep)
+    return xL, xR, y, dcm, dang, keep
+
+if njit is not None:
+    def _make_rds_kernel(a, y_semi, aperture, half_width, check_bounds, dist, half_iod):
+        """Fused parallel version of _rds_batch_numpy with the geometry baked in (float32)."""
+        f32 = np.float32
+        a, y_semi, aperture, half_width, dist, half_iod = (
+            f32(v) for v in (a, y_semi, aperture, half_width, dist, half_iod))
+        inv_dist = f32(1.0) / dist
+        r2_max = aperture * aperture
+        inv_a2, inv_y2 = f32(1.0) / (a * a), f32(1.0) / (y_semi * y_semi)
+        two_ap = f32(2.0) * aperture
+        one, min_depth, zero = f32(1.0), f32(0.5), f32(0.0)
+
+        @njit(parallel=True, fastmath=True, nogil=True)
+        def kernel(u, b, offset_cm, out_xL, out_xR, out_y, out_dcm, out_dang, out_keep):
+            for i in prange(u.shape[0]):
+                x = u[i, 0] * two_ap - aperture
+                y = u[i, 1] * two_ap - aperture
+                x2, y2 = x * x, y * y
+                t = one - x2 * inv_a2
+                z = b * np.sqrt(t) if y2 * inv_y2 <= t else zero
+
+                scale = dist / max(dist - z, min_depth)
+                xL = -half_iod + scale * (x + half_iod)
+                xR = half_iod + scale * (x - half_iod)
+                out_dcm[i] = xR - xL
+                out_dang[i] = (xR - xL) * inv_dist
+
+                xL -= offset_cm
+                xR += offset_cm
+                out_xL[i] = xL
+                out_xR[i] = xR
+                out_y[i] = y
+                out_keep[i] = (x2 + y2 <= r2_max and (not check_bounds or (
+                               abs(xL) <= half_width and abs(xR) <= half_width)))
+        return kernel
+else:
+    _make_rds_kernel = None
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _disparity_sums(dcm, dang, idx):
+        """float64 sum(dcm), sum(dcm^2), sum(dang) over dcm[idx]/dang[idx] in one pass, no gathers."""
+        s_dcm = s_dcm_sq = s_dang = 0.0
+        for i in idx:
+            d = np.float64(dcm[i])  # square in float64, as the NumPy fallback does
+            s_dcm += d
+            s_dcm_sq += d * d
+            s_dang += np.float64(dang[i])
+        return s_dcm, s_dcm_sq, s_dang
+else:
+    def _disparity_sums(dcm, dang, idx):
+        """float64 sum(dcm), sum(dcm^2), sum(dang) over dcm[idx]/dang[idx]."""
+        d = dcm[idx]
+        return (d.sum(dtype=np.float64), np.square(d, dtype=np.float64).sum(),
+                dang[idx].sum(dtype=np.float64))
+
+_rds_kernels = {}  # (a, y_semi, aperture, half_width, check_bounds) -> compiled kernel
+
+def _rds_batch(u, a, b, y_semi, aperture, offset_cm, half_width, check_bounds):
+    """Dispatch one batch to the Numba kernel when available, else the NumPy path."""
+    if _make_rds_kernel is None:
+        return _rds_batch_numpy(u, a, b, y_semi, aperture, offset_cm, half_width, check_bounds)
+    key = (float(a), float(y_semi), float(aperture), float(half_width), bool(check_bounds))
+    kernel = _rds_kernels.get(key)
+    if kernel is None:
+        kernel = _rds_kernels[key] = _make_rds_kernel(*key, _DIST, _HALF_IOD)
+    (xL, xR, y, dcm, dang, _, _), (keep, _) = _batch_buffers(u.shape[0])
+    kernel(u, b, offset_cm, xL, xR, y, dcm, dang, keep)
+    return xL, xR, y, dcm, dang, keep
+
+def generate_rds(a, b, n, y_semi, aperture, width, offset_cm=None, xy_out_L=None, xy_out_R=None):
+    """Return per-eye dot coordinates for a half-elliptical cylinder RDS + disparity stats.
+
+    If (n, 2) float32 xy_out_L/xy_out_R buffers are given, the dots are written into them
+    (x, y columns); otherwise fresh ones are allocated. xL/xR/y are column views of them.
+    """
     offset_cm = haplo_offset_cm if offset_cm is None else offset_cm
-
-    xL_chunks, xR_chunks, y_chunks = [], [], []
-    dcm_chunks, dang_chunks, dfor_chunks = [], [], []
-
+    # float32 while generating (half the memory traffic); disparity sums stay float64
+    a, b, y_semi, aperture, offset_cm, half_width = (
+        np.float32(v) for v in (a, b, y_semi, aperture, offset_cm, width / 2.0))
+
+    # Conservative |x| bound after projection: |x| <= aperture, the nearest depth max(b, 0)
+    # magnifies x + half_iod by at most dist / (dist - b), plus the haploscope shift. When
+    # that fits on the panel the per-dot screen-bounds test can't reject anything.
+    max_scale = _DIST / max(_DIST - max(float(b), 0.0), 0.5)
+    check_bounds = max_scale * (aperture + _HALF_IOD) + _HALF_IOD + abs(offset_cm) > half_width
+
+    # Each batch's kept dots go straight into rows [collected, collected + k) of the outputs
+    if xy_out_L is None:
+        xy_out_L = np.empty((n, 2), dtype=np.float32)
+    if xy_out_R is None:
+        xy_out_R = np.empty((n, 2), dtype=np.float32)
+    # Only the trial summary of the disparities is logged, so accumulate running sums
+    # (float64) per batch instead of returning n-length dcm/dang arrays
+    dcm_sum = dcm_sq_sum = dang_sum = 0.0
+
+    # Square samples land in the aperture with probability pi/4, and on typical rigs nearly
+    # all of those are visible to both eyes, so a pass sized for that plus a 10% margin
+    # normally suffices. Top-up passes are sized from the yield actually observed.
     collected = 0
+    keep_rate = np.pi / 4
+    batch = int(np.ceil(n / keep_rate * 1.1))
     while collected < n:
-        remaining = n - collected
-        batch = max(int(np.ceil(remaining * 1.6)), 64)
-        theta = np.random.uniform(0, 2 * np.pi, batch)
-        r = aperture * np.sqrt(np.random.uniform(0, 1, batch))
-        x, y = r * np.cos(theta), r * np.sin(theta)
-
-        # Half-cylinder surface: inside ellipse gets z>0 (bulges toward observer), outside z=0
-        inside = ((x / a) ** 2 + (y / y_semi) ** 2) <= 1.0
-        z = np.zeros_like(x)
-        if np.any(inside):
-            xin = x[inside]
-            z[inside] = b * np.sqrt(np.clip(1 - (xin / a) ** 2, 0, None))
-
-        xL, xR, dcm, dang, dfor = project_to_screen(x, z, dist, iod)
-        if offset_cm:
-            # Haploscope horizontal calibration (equal and opposite shifts)
-            xL -= offset_cm
-            xR += offset_cm
-
-        # Keep only dots visible to BOTH eyes (prevents monocular ghosts)
-        keep = (np.abs(xL) <= half_width) & (np.abs(xR) <= half_width)
-        kept = int(np.count_nonzero(keep))
-        if kept == 0:
+        u = rng.random((batch, 2), dtype=np.float32)  # both uniforms in one call
+        xL, xR, y, dcm, dang, keep = _rds_batch(u, a, b, y_semi, aperture, offset_cm, half_width,
+                                                check_bounds)
+        hits = np.flatnonzero(keep)
+        keep_rate = max(hits.size / batch, 0.01)
+        idx = hits[:n - collected]
+        if idx.size == 0:
             continue
 
-        xL_chunks.append(xL[keep])
-        xR_chunks.append(xR[keep])
-        y_chunks.append(y[keep])
-        dcm_chunks.append(dcm[keep])
-        dang_chunks.append(dang[keep])
-        dfor_chunks.append(dfor[keep])
-        collected += kept
-
-    def _cat(chunks):
-        if len(chunks) == 1:
-            return chunks[0][:n]
-        return np.concatenate(chunks, axis=0)[:n]
-
-    xL = _cat(xL_chunks)
-    xR = _cat(xR_chunks)
-    y = _cat(y_chunks)
-    dcm = _cat(dcm_chunks)
-    dang = _cat(dang_chunks)
-    dfor = _cat(dfor_chunks)
-    return xL, xR, y, dcm, dang, dfor
+        s_dcm, s_dcm_sq, s_dang = _disparity_sums(dcm, dang, idx)
+        dcm_sum += s_dcm
+        dcm_sq_sum += s_dcm_sq
+        dang_sum += s_dang
+        lo, hi = collected, collected + idx.size
+        for xy_out, x_eye in ((xy_out_L, xL), (xy_out_R, xR)):
+            np.take(x_eye, idx, out=xy_out[lo:hi, 0], mode="clip")  # idx always in range
+            np.take(y, idx, out=xy_out[lo:hi, 1], mode="clip")
+        collected = hi
+        batch = max(int(np.ceil((n - collected) / keep_rate * 1.1)), 64)
+
+    xL, y = xy_out_L[:, 0], xy_out_L[:, 1]
+    xR = xy_out_R[:, 0]
+    mean_dcm = float(dcm_sum / n)
+    std_dcm = math.sqrt(max(dcm_sq_sum / n - mean_dcm ** 2, 0.0))  # population std, as np.std
+    return xL, xR, y, mean_dcm, std_dcm, math.degrees(dang_sum / n)
+
+# Fusion prime: b=0 with no offset is a flat plane at the screen (xL==xR), so the pattern
+# does not depend on the trial and one draw serves the whole session. Both eyes get the
+# LEFT positions → identical xys guarantee zero disparity. This first call also compiles
+# the Numba kernel (when available), keeping JIT latency off trial 1.
+_PRIME_XY = np.empty((n_dots, 2), dtype=np.float32)
+generate_rds(
+    a_cm, 0.0, n_dots, stim_half_height_cm, aperture_radius_cm, screen_width_cm,
+    offset_cm=0.0,  # force zero-disparity regardless of haploscope offset
+    xy_out_L=_PRIME_XY
+)
 # ====================================================================
 
 # === Reusable drawables ===
@@ -172,115 +348,167 @@ question_right = visual.TextStim(win_right, text=question_text, pos=(0, -5), hei
 kb = keyboard.Keyboard()
 default_kb = keyboard.Keyboard()  # listens for ESC anywhere
 
+# ESC stays buffered between polls, so checking every 8th frame only delays the quit
+# (≤ ~130 ms at 60 Hz). Keyboards share one buffer: poll unthrottled before clearEvents()
+_esc_tick = 0
+def check_escape():
+    global _esc_tick
+    _esc_tick += 1
+    if _esc_tick & 7 == 0 and default_kb.getKeys(["escape"], waitRelease=False):
+        terminate_experiment()
+
 # ============================== TEST MODE =============================
 if TEST_MODE:
     print("TEST MODE: 10 s convex cylinder + nonius bars. Swap LEFT/RIGHT indices if it looks concave.")
     b_test = 9.95
-    xL, xR, y, *_ = generate_rds(a_cm, b_test, screen_distance_cm, interocular_cm,
+    xL, xR, y, *_ = generate_rds(a_cm, b_test,
 @@ -213,104 +239,122 @@ if TEST_MODE:
     print("Adjust 'haploscope_offset_cm' until the nonius bars form ONE straight line. Press any key to continue...")
     while not kb.getKeys(waitRelease=False):
         fix_left.draw();  fix_right.draw()
         nonius_left.draw(); nonius_right.draw()
         win_left.flip();   win_right.flip()
-        if default_kb.getKeys(["escape"], waitRelease=False): terminate_experiment()
+        check_escape()
 # ======================================================================
 
 # ============================= TRIALS =================================
+n_reps = 3
 conditions = [{"b_cm": b} for b in b_values_cm]
-trials = data.TrialHandler(trialList=conditions, nReps=3, method="random", extraInfo=exp_info)
+trials = data.TrialHandler(trialList=conditions, nReps=n_reps, method="random", extraInfo=exp_info)
 this_exp.addLoop(trials)
 
-deg_per_rad = 180.0 / np.pi
+# Static RDS: pre-generate one fresh pattern per repetition of each b up front, so no
+# RNG/projection work runs between trials; each trial pops the next pattern for its b.
+# Dots are written straight into that pattern's own per-eye (n, 2) xys buffers, which
+# the trial then hands to dotsL/dotsR as-is.
+def make_static_rds(b):
+    xy_L = np.empty((n_dots, 2), dtype=np.float32)
+    xy_R = np.empty((n_dots, 2), dtype=np.float32)
+    stats = generate_rds(a_cm, b, n_dots, stim_half_height_cm, aperture_radius_cm, screen_width_cm,
+                         xy_out_L=xy_L, xy_out_R=xy_R)[3:]
+    return (xy_L, xy_R, *stats)
+
+if not DYNAMIC_RDS:
+    rds_cache = {b: [make_static_rds(b) for _ in range(n_reps)] for b in b_values_cm}
+
+# Dot stims are built once; trials only assign new xys
+primeL = visual.ElementArrayStim(win_left,  nElements=n_dots, elementTex=None, elementMask="circle",
+                                 xys=_PRIME_XY, sizes=dot_size_cm, colors="white")
+primeR = visual.ElementArrayStim(win_right, nElements=n_dots, elementTex=None, elementMask="circle",
+                                 xys=_PRIME_XY, sizes=dot_size_cm, colors="white")
+dotsL = visual.ElementArrayStim(win_left,  nElements=n_dots, elementTex=None, elementMask="circle",
+                                sizes=dot_size_cm, colors="white")
+dotsR = visual.ElementArrayStim(win_right, nElements=n_dots, elementTex=None, elementMask="circle",
+                                sizes=dot_size_cm, colors="white")
+
+# One worker thread for RDS generation. Numba kernels run without the GIL; the NumPy
+# fallback holds it between its many small ufunc calls, so it overlaps the prime less.
+_rds_executor = ThreadPoolExecutor(max_workers=1)
+
+prime_frames = int(round(FUSION_PRIME_SEC * refresh_min_hz))
+post_fix_frames = int(POST_FIX_SEC * refresh_min_hz)
+update_interval = max(int(DYNAMIC_RDS_UPDATE_EVERY), 1)
+
+if DYNAMIC_RDS:
+    bank_len = max(int(DYNAMIC_RDS_BANK_SIZE), 1)
+    # Contiguous per-eye (bank, n, 2) xys tensors, allocated once and refilled in place
+    # every trial: frame updates become plain view assignments
+    bankL = np.empty((bank_len, n_dots, 2), dtype=np.float32)
+    bankR = np.empty((bank_len, n_dots, 2), dtype=np.float32)
+
+    # Static RDS comes from rds_cache; DYNAMIC_RDS=True refills the bank for each trial's b
+    def regenerate_cylinder(b, xy_out_L=None, xy_out_R=None):
+        return generate_rds(
+            a_cm, b, n_dots, stim_half_height_cm, aperture_radius_cm, screen_width_cm,
+            xy_out_L=xy_out_L, xy_out_R=xy_out_R
+        )
+
+    def fill_bank_frame(b, i):
+        return regenerate_cylinder(b, xy_out_L=bankL[i], xy_out_R=bankR[i])[3:]  # disparity stats
+
+    def fill_bank(b):
+        stats = fill_bank_frame(b, 0)  # frame 0's disparities are the ones logged
+        for i in range(1, bank_len):
+            fill_bank_frame(b, i)
+        return stats
+
+bank_future = None  # next trial's bank, prefetched during the previous response window
 
 for trial in trials:
     b = trial["b_cm"]
 
-    # ---------------- FUSION PRIME (zero-disparity noise) ----------------
-    # We render a dot field with b=0 (z=0 for all points). For true zero-disparity,
-    # we also FORCE both eyes to see IDENTICAL xys (use LEFT positions for both).
-    prime_frames = int(round(FUSION_PRIME_SEC * refresh_min_hz))
-    xL_p, xR_p, y_p, *_ = generate_rds(
-        a_cm, 0.0,  # b=0 → flat plane at the screen → xL==xR in projection
-        screen_distance_cm, interocular_cm,
-        n_dots, stim_half_height_cm, aperture_radius_cm, screen_width_cm,
-        offset_cm=0.0  # force zero-disparity regardless of haploscope offset
-    )
-    prime_xy = np.column_stack((xL_p, y_p))  # identical positions to both eyes → guarantees zero disparity
-    primeL = visual.ElementArrayStim(win_left,  nElements=n_dots, elementTex=None, elementMask="circle",
-                                     xys=prime_xy, sizes=dot_size_cm, colors="white")
-    primeR = visual.ElementArrayStim(win_right, nElements=n_dots, elementTex=None, elementMask="circle",
-                                     xys=prime_xy, sizes=dot_size_cm, colors="white")
+    # First trial: build the bank on the worker thread while the fusion prime plays
+    if DYNAMIC_RDS and bank_future is None:
+        bank_future = _rds_executor.submit(fill_bank, b)
 
+    # ---------------- FUSION PRIME (zero-disparity noise) ----------------
+    # primeL/primeR already hold the session's precomputed zero-disparity pattern (_PRIME_XY)
     for _ in range(prime_frames):
         fix_left.draw();  fix_right.draw()
         nonius_left.draw(); nonius_right.draw()  # show nonius during prime to fine-tune offset live
         primeL.draw();    primeR.draw()
         win_left.flip();  win_right.flip()
-        if default_kb.getKeys(["escape"], waitRelease=False): terminate_experiment()
+        check_escape()
     # ---------------------------------------------------------------------
 
     # ---------------------- CYLINDER STIMULUS -----------------------------
-    # Generate one static RDS for this condition (unless DYNAMIC_RDS=True)
-    def regenerate_cylinder():
-        return generate_rds(
-            a_cm, b, screen_distance_cm, interocular_cm,
-            n_dots, stim_half_height_cm, aperture_radius_cm, screen_width_cm
-        )
-
     if DYNAMIC_RDS:
-        bank_len = max(int(DYNAMIC_RDS_BANK_SIZE), 1)
-        rds_bank = [regenerate_cylinder() for _ in range(bank_len)]
+        mean_dcm, std_dcm, mean_dang_deg = bank_future.result()
+        bank_future = None
         bank_index = 0
-        xL, xR, y, dcm, dang, dfor = rds_bank[bank_index]
+        stim_xy_L, stim_xy_R = bankL[0], bankR[0]
     else:
-        xL, xR, y, dcm, dang, dfor = regenerate_cylinder()
-    baseL = np.column_stack((xL, y))
-    baseR = np.column_stack((xR, y))
-
-    dotsL = visual.ElementArrayStim(win_left,  nElements=n_dots, elementTex=None, elementMask="circle",
-                                    xys=baseL, sizes=dot_size_cm, colors="white")
-    dotsR = visual.ElementArrayStim(win_right, nElements=n_dots, elementTex=None, elementMask="circle",
-                                    xys=baseR, sizes=dot_size_cm, colors="white")
+        stim_xy_L, stim_xy_R, mean_dcm, std_dcm, mean_dang_deg = rds_cache[b].pop()
 
-    update_interval = max(int(DYNAMIC_RDS_UPDATE_EVERY), 1)
+    dotsL.xys = stim_xy_L
+    dotsR.xys = stim_xy_R
 
     for f in range(stim_frames):
-        if DYNAMIC_RDS and f % update_interval == 0:
-            if f != 0:
-                bank_index = (bank_index + 1) % len(rds_bank)
-                if bank_index == 0:
-                    rds_bank = [regenerate_cylinder() for _ in range(len(rds_bank))]
-                xL_dyn, xR_dyn, y_dyn, *_ = rds_bank[bank_index]
-            else:
-                xL_dyn, xR_dyn, y_dyn = xL, xR, y
-            dotsL.xys = np.column_stack((xL_dyn, y_dyn))
-            dotsR.xys = np.column_stack((xR_dyn, y_dyn))
+        if DYNAMIC_RDS and f != 0 and f % update_interval == 0:
+            bank_index = (bank_index + 1) % bank_len
+            if bank_index == 0:
+                fill_bank(b)
+            dotsL.xys = bankL[bank_index]
+            dotsR.xys = bankR[bank_index]
         fix_left.draw();  fix_right.draw()
         # (no nonius during the actual depth stimulus — reduces distraction)
         dotsL.draw();     dotsR.draw()
         win_left.flip();  win_right.flip()
-        if default_kb.getKeys(["escape"], waitRelease=False): terminate_experiment()
+        check_escape()
     # ---------------------------------------------------------------------
 
     # Post-stim fixation (brief pause before the question)
-    for _ in range(int(POST_FIX_SEC * refresh_min_hz)):
+    for _ in range(post_fix_frames):
         fix_left.draw();  fix_right.draw()
         win_left.flip();  win_right.flip()
-        if default_kb.getKeys(["escape"], waitRelease=False): terminate_experiment()
+        check_escape()
 
     # ----------------------------- RESPONSE -------------------------------
-    kb.clearEvents(); kb.clock.reset()
+    # The bank is off screen now, so the next trial's frames can be built while the
+    # participant answers; the next fusion prime then starts with them ready.
+    next_trial = trials.getFutureTrial(1)
+    if DYNAMIC_RDS and next_trial is not None:
+        bank_future = _rds_executor.submit(fill_bank, next_trial["b_cm"])
+
+    # The question is static: draw and flip it once, then poll the keyboard on a short
+    # timer instead of redrawing at the refresh rate. RT is timed from the question flip.
+    fix_left.draw();  fix_right.draw()
+    question_left.draw(); question_right.draw()
+    if default_kb.getKeys(["escape"], waitRelease=False):  # before clearEvents() drops it
+        terminate_experiment()
+    kb.clearEvents()
+    win_left.callOnFlip(kb.clock.reset)
+    win_left.flip();  win_right.flip()
     response_key, response_rt = None, None
     while response_key is None:
-        fix_left.draw();  fix_right.draw()
-        question_left.draw(); question_right.draw()
-        win_left.flip();  win_right.flip()
-        if default_kb.getKeys(["escape"], waitRelease=False): terminate_experiment()
-        keys = kb.getKeys(["1", "2"], waitRelease=False)
+        keys = kb.getKeys(["1", "2", "escape"], waitRelease=False)
         if keys:
             k = keys[0]
+            if k.name == "escape":
+                terminate_experiment()
             response_key, response_rt = k.name, k.rt
+        else:
+            core.wait(0.002, hogCPUperiod=0.001)
     response_label = "squashed" if response_key == "1" else "stretched"
     # ---------------------------------------------------------------------
 
@@ -289,9 +517,9 @@ for trial in trials:
     trials.addData("response_key", response_key)
     trials.addData("response_label", response_label)
     trials.addData("rt", response_rt)
-    trials.addData("disparity_mean_cm", float(np.mean(dcm)))
-    trials.addData("disparity_std_cm", float(np.std(dcm)))
-    trials.addData("disparity_angle_mean_deg", float(np.mean(dang) * deg_per_rad))
+    trials.addData("disparity_mean_cm", mean_dcm)
+    trials.addData("disparity_std_cm", std_dcm)
+    trials.addData("disparity_angle_mean_deg", mean_dang_deg)
     trials.addData("refresh_min_hz", refresh_min_hz)
     trials.addData("refresh_left_hz", fr_left)
     trials.addData("refresh_right_hz", fr_right)